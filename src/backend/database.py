@@ -50,6 +50,13 @@ def init_database():
             teachers_collection.insert_one(
                 {"_id": teacher["username"], **teacher})
 
+    # Index the activity filters: equality on day first, then the time ranges
+    activities_collection.create_index([
+        ("schedule_details.days", 1),
+        ("schedule_details.start_time", 1),
+        ("schedule_details.end_time", 1)
+    ])
+
 
 # Initial database if empty
 initial_activities = {
@@ -2,11 +2,12 @@
 Endpoints for the High School Management System API
 """
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import RedirectResponse
 from typing import Dict, Any, Optional, List
 
-from ..database import activities_collection, teachers_collection
+from ..database import activities_collection
+from .auth import require_teacher
 
 router = APIRouter(
     prefix="/activities",
@@ -52,49 +53,28 @@ def get_activities(
 @router.get("/days", response_model=List[str])
 def get_available_days() -> List[str]:
     """Get a list of all days that have activities scheduled"""
-    # Aggregate to get unique days across all activities
-    pipeline = [
-        {"$unwind": "$schedule_details.days"},
-        {"$group": {"_id": "$schedule_details.days"}},
-        {"$sort": {"_id": 1}}  # Sort days alphabetically
-    ]
+    # Let the server collect the unique days (distinct unwinds the array)
+    days = activities_collection.distinct("schedule_details.days")
 
-    days = []
-    for day_doc in activities_collection.aggregate(pipeline):
-        days.append(day_doc["_id"])
-
-    return days
+    return sorted(days)  # Sort days alphabetically
 
 
 @router.post("/{activity_name}/signup")
-def signup_for_activity(activity_name: str, email: str, teacher_username: Optional[str] = Query(None)):
+def signup_for_activity(activity_name: str, email: str, teacher_username: str = Depends(require_teacher)):
     """Sign up a student for an activity - requires teacher authentication"""
-    # Check teacher authentication
-    if not teacher_username:
-        raise HTTPException(
-            status_code=401, detail="Authentication required for this action")
-
-    teacher = teachers_collection.find_one({"_id": teacher_username})
-    if not teacher:
-        raise HTTPException(
-            status_code=401, detail="Invalid teacher credentials")
-
-    # Get the activity
-    activity = activities_collection.find_one({"_id": activity_name})
-    if not activity:
-        raise HTTPException(status_code=404, detail="Activity not found")
-
-    # Validate student is not already signed up
-    if email in activity["participants"]:
-        raise HTTPException(
-            status_code=400, detail="Already signed up for this activity")
-
-    # Add student to participants
+    # Add student to participants, only if not already signed up
     result = activities_collection.update_one(
-        {"_id": activity_name},
+        {"_id": activity_name, "participants": {"$ne": email}},
         {"$push": {"participants": email}}
     )
 
+    if result.matched_count == 0:
+        # Only look the activity up again to report the right error
+        if not activities_collection.find_one({"_id": activity_name}, {"_id": 1}):
+            raise HTTPException(status_code=404, detail="Activity not found")
+        raise HTTPException(
+            status_code=400, detail="Already signed up for this activity")
+
     if result.modified_count == 0:
         raise HTTPException(
             status_code=500, detail="Failed to update activity")
@@ -103,34 +83,21 @@ def signup_for_activity(activity_name: str, email: str, teacher_username: Option
 
 
 @router.post("/{activity_name}/unregister")
-def unregister_from_activity(activity_name: str, email: str, teacher_username: Optional[str] = Query(None)):
+def unregister_from_activity(activity_name: str, email: str, teacher_username: str = Depends(require_teacher)):
     """Remove a student from an activity - requires teacher authentication"""
-    # Check teacher authentication
-    if not teacher_username:
-        raise HTTPException(
-            status_code=401, detail="Authentication required for this action")
-
-    teacher = teachers_collection.find_one({"_id": teacher_username})
-    if not teacher:
-        raise HTTPException(
-            status_code=401, detail="Invalid teacher credentials")
-
-    # Get the activity
-    activity = activities_collection.find_one({"_id": activity_name})
-    if not activity:
-        raise HTTPException(status_code=404, detail="Activity not found")
-
-    # Validate student is signed up
-    if email not in activity["participants"]:
-        raise HTTPException(
-            status_code=400, detail="Not registered for this activity")
-
-    # Remove student from participants
+    # Remove student from participants, only if signed up
     result = activities_collection.update_one(
-        {"_id": activity_name},
+        {"_id": activity_name, "participants": email},
         {"$pull": {"participants": email}}
     )
 
+    if result.matched_count == 0:
+        # Only look the activity up again to report the right error
+        if not activities_collection.find_one({"_id": activity_name}, {"_id": 1}):
+            raise HTTPException(status_code=404, detail="Activity not found")
+        raise HTTPException(
+            status_code=400, detail="Not registered for this activity")
+
     if result.modified_count == 0:
         raise HTTPException(
             status_code=500, detail="Failed to update activity")
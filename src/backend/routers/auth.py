@@ -2,8 +2,8 @@
 Authentication endpoints for the High School Management System API
 """
 
-from fastapi import APIRouter, HTTPException
-from typing import Dict, Any
+from fastapi import APIRouter, HTTPException, Query
+from typing import Dict, Any, Optional
 
 from ..database import teachers_collection, verify_password
 
@@ -13,6 +13,24 @@ router = APIRouter(
 )
 
 
+def require_teacher(teacher_username: Optional[str] = Query(None)) -> str:
+    """Dependency for endpoints that require teacher authentication
+
+    Returns the authenticated teacher's username.
+    """
+    if not teacher_username:
+        raise HTTPException(
+            status_code=401, detail="Authentication required for this action")
+
+    teacher = teachers_collection.find_one(
+        {"_id": teacher_username}, {"_id": 1})
+    if not teacher:
+        raise HTTPException(
+            status_code=401, detail="Invalid teacher credentials")
+
+    return teacher_username
+
+
 @router.post("/login")
 def login(username: str, password: str) -> Dict[str, Any]:
     """Login a teacher account"""
@@ -35,7 +53,11 @@ def login(username: str, password: str) -> Dict[str, Any]:
 @router.get("/check-session")
 def check_session(username: str) -> Dict[str, Any]:
     """Check if a session is valid by username"""
-    teacher = teachers_collection.find_one({"_id": username})
+    # Only fetch the fields returned to the client (never the password hash)
+    teacher = teachers_collection.find_one(
+        {"_id": username},
+        {"_id": 0, "username": 1, "display_name": 1, "role": 1}
+    )
 
     if not teacher:
         raise HTTPException(status_code=404, detail="Teacher not found")